@@ -37,6 +37,7 @@ import sys
 import json
 import time
 import argparse
+import threading
 from dataclasses import dataclass, asdict
 from typing import Optional
 from urllib.request import urlopen, Request
@@ -63,7 +64,7 @@ IANA_RDAP_BOOTSTRAP = "https://data.iana.org/rdap/dns.json"
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DomainResult:
     """Result of a domain availability check."""
     domain: str
@@ -227,7 +228,8 @@ def check_domain(domain: str) -> DomainResult:
         )
 
 def check_domains(domains: list[str], delay: float = REQUEST_DELAY,
-                  progress: bool = True) -> list[DomainResult]:
+                  progress: bool = True,
+                  cancel_event: Optional[threading.Event] = None) -> list[DomainResult]:
     """
     Check availability of multiple domains.
 
@@ -235,14 +237,18 @@ def check_domains(domains: list[str], delay: float = REQUEST_DELAY,
         domains: List of domain names to check
         delay: Seconds to wait between requests (default 0.5)
         progress: Whether to print progress to stderr
+        cancel_event: If set (e.g. from another thread), stop before the next domain
 
     Returns:
-        List of DomainResult objects
+        List of DomainResult objects (partial if cancelled)
     """
     results = []
     total = len(domains)
 
     for i, domain in enumerate(domains):
+        if cancel_event and cancel_event.is_set():
+            break
+
         if progress:
             print(f"Checking {i+1}/{total}: {domain}...", file=sys.stderr)
 
@@ -251,7 +257,11 @@ def check_domains(domains: list[str], delay: float = REQUEST_DELAY,
 
         # Rate limiting - don't hammer the servers
         if i < total - 1:
-            time.sleep(delay)
+            if cancel_event:
+                # Wakes early if cancelled mid-delay
+                cancel_event.wait(delay)
+            else:
+                time.sleep(delay)
 
     return results
 
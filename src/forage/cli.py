@@ -9,27 +9,65 @@ import asyncio
 import sys
 import argparse
 import json
-from typing import List, Optional
+import threading
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from .checker import check_domain, check_domains, DomainResult
-from .pricing import get_domain_pricing, get_batch_pricing, categorize_domains_by_pricing
+from .pricing import (
+    get_domain_pricing,
+    get_batch_pricing,
+    categorize_domains_by_pricing,
+    preload_pricing,
+    CATEGORY_SYMBOLS,
+    close_pricing_client,
+    DomainPrice,
+)
 from .config import config
-from .orchestrator import DomainSearchOrchestrator, SearchState, quick_search
-from .quiz.schema import InitialQuiz
+from .orchestrator import DomainSearchOrchestrator, quick_search
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json is the fallback
+    orjson = None
+
+# Status label and ANSI color per RDAP status
+_STATUS_STYLES = {
+    "AVAILABLE": ("✓ AVAILABLE", "\033[92m"),  # Green
+    "REGISTERED": ("✗ REGISTERED", "\033[91m"),  # Red
+    "UNKNOWN": ("? UNKNOWN", "\033[93m"),  # Yellow
+}
+
+
+def _json_dumps_indented(obj) -> str:
+    """Pretty-print JSON for terminal output, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _run(coro):
+    """Run a coroutine on uvloop when installed, else the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def read_domains_file(path: Path) -> Iterator[str]:
+    """Yield domains from a file, one per line, skipping blanks and # comments."""
+    with open(path, "r") as f:
+        for line in f:
+            domain = line.strip()
+            if domain and domain[0] != "#":
+                yield domain
 
 
 def format_domain_result(result: DomainResult, price_info=None) -> str:
     """Format a single domain result for terminal output."""
-    if result.status == "AVAILABLE":
-        status = "✓ AVAILABLE"
-        color = "\033[92m"  # Green
-    elif result.status == "REGISTERED":
-        status = "✗ REGISTERED"
-        color = "\033[91m"  # Red
-    else:
-        status = "? UNKNOWN"
-        color = "\033[93m"  # Yellow
+    status, color = _STATUS_STYLES.get(result.status, _STATUS_STYLES["UNKNOWN"])
     
     # Base status line
     output = f"{color}{result.domain}: {status}\033[0m"
@@ -55,90 +93,109 @@ def format_domain_result(result: DomainResult, price_info=None) -> str:
     return output
 
 
-def print_results_summary(results: List[DomainResult], pricing_info: dict = None):
+def print_results_summary(
+    results: List[DomainResult], pricing_info: Optional[Dict[str, DomainPrice]] = None
+):
     """Print a formatted summary of results."""
-    # Group by status
-    available = [r for r in results if r.status == "AVAILABLE"]
-    registered = [r for r in results if r.status == "REGISTERED"]
-    unknown = [r for r in results if r.status == "UNKNOWN"]
+    # Group by status in one pass
+    available: List[DomainResult] = []
+    registered: List[DomainResult] = []
+    unknown: List[DomainResult] = []
+    bucket = {"AVAILABLE": available.append, "REGISTERED": registered.append}
+    for result in results:
+        bucket.get(result.status, unknown.append)(result)
     
-    print("\n" + "=" * 60)
-    print("DOMAIN CHECK RESULTS")
-    print("=" * 60)
+    # Collect every line and write once instead of a print() per line
+    parts: List[str] = ["", "=" * 60, "DOMAIN CHECK RESULTS", "=" * 60]
     
     # Available domains with pricing
     if available:
-        print(f"\n🟢 AVAILABLE ({len(available)}):")
+        parts.append(f"\n🟢 AVAILABLE ({len(available)}):")
         for result in available:
             price_info = pricing_info.get(result.domain) if pricing_info else None
-            print(f"  {format_domain_result(result, price_info)}")
+            parts.append("  " + format_domain_result(result, price_info))
         
         # Pricing summary for available domains
         if pricing_info:
-            available_pricing = [pricing_info[d.domain] for d in available if d.domain in pricing_info]
-            if available_pricing:
+            # Only need to know some available domain is priced - stop at the first
+            if any(r.domain in pricing_info for r in available):
                 categories = categorize_domains_by_pricing(pricing_info)
-                print(f"\n    Pricing Summary:")
+                parts.append("\n    Pricing Summary:")
                 for category, domains in categories.items():
                     if domains:
-                        symbol = {
-                            "bundled": "📦",
-                            "recommended": "✅",
-                            "standard": "🔹",
-                            "premium": "💎"
-                        }.get(category, "🔹")
-                        print(f"      {symbol} {category.title()}: {len(domains)} domains")
+                        symbol = CATEGORY_SYMBOLS.get(category, "🔹")
+                        parts.append(f"      {symbol} {category.title()}: {len(domains)} domains")
     
     # Registered domains
     if registered:
-        print(f"\n🔴 REGISTERED ({len(registered)}):")
+        parts.append(f"\n🔴 REGISTERED ({len(registered)}):")
         for result in registered:
-            print(f"  {format_domain_result(result)}")
+            parts.append("  " + format_domain_result(result))
     
     # Unknown status
     if unknown:
-        print(f"\n🟡 UNKNOWN ({len(unknown)}):")
+        parts.append(f"\n🟡 UNKNOWN ({len(unknown)}):")
         for result in unknown:
-            print(f"  {format_domain_result(result)}")
+            parts.append("  " + format_domain_result(result))
     
-    print()
+    parts.append("")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
-async def check_single_domain(domain: str, include_pricing: bool = True) -> DomainResult:
+async def check_single_domain(
+    domain: str, include_pricing: bool = True
+) -> Tuple[DomainResult, Dict[str, DomainPrice]]:
     """Check a single domain with optional pricing."""
     result = check_domain(domain)
+    pricing_info: Dict[str, DomainPrice] = {}
     
     if include_pricing and result.status == "AVAILABLE":
         try:
             pricing = await get_domain_pricing(domain)
             if pricing:
-                # Store pricing info for later use
-                result._pricing_info = pricing
+                pricing_info[result.domain] = pricing
         except Exception as e:
             print(f"Warning: Could not fetch pricing for {domain}: {e}", file=sys.stderr)
     
-    return result
+    return result, pricing_info
 
 
-async def check_multiple_domains(domains: List[str], include_pricing: bool = True) -> List[DomainResult]:
+async def check_multiple_domains(
+    domains: List[str], include_pricing: bool = True
+) -> Tuple[List[DomainResult], Dict[str, DomainPrice]]:
     """Check multiple domains with optional pricing."""
-    # First check availability
-    results = check_domains(domains, delay=config.rate_limit.rdap_delay_seconds, progress=True)
-    
-    # Then fetch pricing for available domains
-    if include_pricing:
+    # Start loading the pricing table while RDAP checks run
+    pricing_task = asyncio.create_task(preload_pricing()) if include_pricing else None
+    pricing_info: Dict[str, DomainPrice] = {}
+    cancel_event = threading.Event()
+
+    try:
+        # Availability checks block on network I/O, so keep them off the event loop
+        results = await asyncio.to_thread(
+            check_domains,
+            domains,
+            delay=config.rate_limit.rdap_delay_seconds,
+            progress=True,
+            cancel_event=cancel_event,
+        )
+        
+        # Then fetch pricing for available domains
         available_domains = [r.domain for r in results if r.status == "AVAILABLE"]
-        if available_domains:
+        if pricing_task and available_domains:
             try:
+                await pricing_task
                 pricing_info = await get_batch_pricing(available_domains)
-                # Attach pricing to results
-                for result in results:
-                    if result.domain in pricing_info:
-                        result._pricing_info = pricing_info[result.domain]
             except Exception as e:
                 print(f"Warning: Could not fetch pricing: {e}", file=sys.stderr)
+    finally:
+        # On cancel (e.g. Ctrl-C) the worker thread stops before its next domain
+        cancel_event.set()
+        if pricing_task:
+            # Drop an unneeded or abandoned preload without surfacing its errors
+            pricing_task.cancel()
+            await asyncio.gather(pricing_task, return_exceptions=True)
     
-    return results
+    return results, pricing_info
 
 
 def main():
@@ -227,10 +284,9 @@ def main():
             # Check if it's a file
             try:
                 file_path = Path(item)
-                if file_path.exists() and file_path.is_file():
-                    with open(file_path, "r") as f:
-                        file_domains = [line.strip() for line in f if line.strip() and not line.startswith("#")]
-                        domains.extend(file_domains)
+                # is_file() is a single stat and is False for missing paths
+                if file_path.is_file():
+                    domains.extend(read_domains_file(file_path))
                 else:
                     # Not a file, treat as domain name
                     domains.append(item)
@@ -246,54 +302,37 @@ def main():
         include_pricing = not args.no_pricing
         
         async def run_checks():
-            if len(domains) == 1:
-                results = [await check_single_domain(domains[0], include_pricing)]
-            else:
-                results = await check_multiple_domains(domains, include_pricing)
-            
-            # Extract pricing info for output
-            pricing_info = {}
-            if include_pricing:
-                for result in results:
-                    if hasattr(result, '_pricing_info'):
-                        pricing_info[result.domain] = result._pricing_info
+            try:
+                if len(domains) == 1:
+                    result, pricing_info = await check_single_domain(domains[0], include_pricing)
+                    results = [result]
+                else:
+                    results, pricing_info = await check_multiple_domains(domains, include_pricing)
+            finally:
+                # Release pooled pricing connections before the loop closes
+                await close_pricing_client()
             
             # Output
             if args.json:
                 # Convert to JSON
                 json_results = []
                 for result in results:
-                    result_dict = {
-                        "domain": result.domain,
-                        "status": result.status,
-                        "registrar": result.registrar,
-                        "expiration": result.expiration,
-                        "creation": result.creation,
-                        "error": result.error
-                    }
+                    result_dict = asdict(result)
                     
                     # Add pricing if available
-                    if result.domain in pricing_info:
-                        price = pricing_info[result.domain]
-                        result_dict["pricing"] = {
-                            "price_cents": price.price_cents,
-                            "price_dollars": price.price_dollars,
-                            "currency": price.currency,
-                            "category": price.category,
-                            "is_bundled": price.is_bundled,
-                            "is_recommended": price.is_recommended,
-                            "is_premium": price.is_premium
-                        }
+                    price = pricing_info.get(result.domain)
+                    if price:
+                        result_dict["pricing"] = price.to_dict()
                     
                     json_results.append(result_dict)
                 
-                print(json.dumps(json_results, indent=2))
+                print(_json_dumps_indented(json_results))
             else:
                 # Human-readable output
                 print_results_summary(results, pricing_info if include_pricing else None)
         
         # Run the async function
-        asyncio.run(run_checks())
+        _run(run_checks())
 
     elif args.command == "search":
         # AI-powered domain search
@@ -307,14 +346,18 @@ def main():
             print()
 
             # Run the search
-            result = await quick_search(
-                business_name=args.business_name,
-                vibe=args.vibe,
-                tld_preferences=args.tlds,
-                keywords=args.keywords,
-                max_batches=args.batches,
-                use_mock=args.mock or True,  # Default to mock for now
-            )
+            try:
+                result = await quick_search(
+                    business_name=args.business_name,
+                    vibe=args.vibe,
+                    tld_preferences=args.tlds,
+                    keywords=args.keywords,
+                    max_batches=args.batches,
+                    use_mock=args.mock or True,  # Default to mock for now
+                )
+            finally:
+                # Release pooled pricing connections before the loop closes
+                await close_pricing_client()
 
             # Create orchestrator for output formatting
             orchestrator = DomainSearchOrchestrator(use_mock=True)
@@ -332,7 +375,7 @@ def main():
                     "available_domains": len(result.available_domains),
                     "domains": [r.to_dict() for r in orchestrator.get_ranked_results(result)],
                 }
-                print(json.dumps(output, indent=2))
+                print(_json_dumps_indented(output))
             else:
                 # Terminal-style output
                 print(orchestrator.format_results_terminal(result))
@@ -350,7 +393,7 @@ def main():
                 print(f"  Tokens: {usage.total_tokens:,} ({usage.input_tokens:,} in / {usage.output_tokens:,} out)")
                 print(f"  Est. Cost: ${usage.estimated_cost_usd:.4f}")
 
-        asyncio.run(run_search())
+        _run(run_search())
 
 
 if __name__ == "__main__":
@@ -9,39 +9,65 @@ Provides pricing information for available domains and categorizes them
 based on configured thresholds (bundled, recommended, premium).
 """
 
+import asyncio
+import importlib.util
 import json
-import httpx
+import os
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Optional, Dict, List
 
 from .config import config
 
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json is the fallback
+    orjson = None
+
 
 # Cache configuration
 PRICING_API_URL = "https://cfdomainpricing.com/prices.json"
 CACHE_TTL_SECONDS = 86400  # 24 hours
-CACHE_FILE_NAME = ".cloudflare_pricing_cache.json"
+CACHE_DIR_NAME = "forage"
+CACHE_FILE_NAME = "cloudflare_pricing.json"
 
+# Display symbol per pricing category
+CATEGORY_SYMBOLS = {
+    "bundled": "📦",
+    "recommended": "✅",
+    "standard": "🔹",
+    "premium": "💎",
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DomainPrice:
     """Pricing information for a domain."""
     domain: str
     tld: str
     price_cents: int
     currency: str = "USD"
-    is_premium: bool = False
-    is_bundled: bool = False
-    is_recommended: bool = False
     annual_renewal_cents: Optional[int] = None
 
-    def __post_init__(self):
-        """Categorize based on pricing thresholds."""
-        self.is_bundled = self.price_cents <= config.pricing.bundled_max_cents
-        self.is_recommended = self.price_cents <= config.pricing.recommended_max_cents
-        self.is_premium = self.price_cents >= config.pricing.premium_flag_above_cents
+    @property
+    def is_bundled(self) -> bool:
+        """Price fits within the bundled tier."""
+        return self.price_cents <= config.pricing.bundled_max_cents
+
+    @property
+    def is_recommended(self) -> bool:
+        """Price fits within the recommended tier."""
+        return self.price_cents <= config.pricing.recommended_max_cents
+
+    @property
+    def is_premium(self) -> bool:
+        """Price is at or above the premium flag."""
+        return self.price_cents >= config.pricing.premium_flag_above_cents
 
     @property
     def price_dollars(self) -> float:
@@ -51,23 +77,32 @@ class DomainPrice:
     @property
     def category(self) -> str:
         """Get pricing category."""
-        if self.is_bundled:
+        thresholds = config.pricing
+        price_cents = self.price_cents
+        if price_cents <= thresholds.bundled_max_cents:
             return "bundled"
-        elif self.is_recommended:
+        elif price_cents <= thresholds.recommended_max_cents:
             return "recommended"
-        elif self.is_premium:
+        elif price_cents >= thresholds.premium_flag_above_cents:
             return "premium"
         else:
             return "standard"
 
+    def to_dict(self) -> dict:
+        """Serialize pricing, including the derived tier flags."""
+        return {
+            "price_cents": self.price_cents,
+            "price_dollars": self.price_dollars,
+            "currency": self.currency,
+            "category": self.category,
+            "is_bundled": self.is_bundled,
+            "is_recommended": self.is_recommended,
+            "is_premium": self.is_premium,
+        }
+
     def __str__(self) -> str:
         """Human-readable pricing info."""
-        category_symbol = {
-            "bundled": "📦",
-            "recommended": "✅",
-            "premium": "💎",
-            "standard": "🔹"
-        }.get(self.category, "🔹")
+        category_symbol = CATEGORY_SYMBOLS.get(self.category, "🔹")
 
         return f"{category_symbol} {self.domain}: ${self.price_dollars:.2f} ({self.category})"
 
@@ -77,18 +112,36 @@ class PricingError(Exception):
     pass
 
 
-def _get_cache_path() -> Path:
-    """Get the cache file path in the project root or temp directory."""
-    # Try project root first
-    project_root = Path(__file__).parent.parent.parent
-    cache_path = project_root / CACHE_FILE_NAME
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
 
-    # Fallback to temp directory if project root isn't writable
-    if not project_root.exists():
-        import tempfile
-        cache_path = Path(tempfile.gettempdir()) / CACHE_FILE_NAME
 
-    return cache_path
+def _extract_tld(domain: str) -> str:
+    """Get the lowercased TLD of a domain without splitting every label."""
+    return domain.rsplit(".", 1)[-1].lower()
+
+
+def _get_cache_path() -> Path:
+    """Get the cache file path in the user cache directory or temp directory."""
+    cache_root = os.getenv("XDG_CACHE_HOME")
+    if not cache_root:
+        try:
+            cache_root = Path.home() / ".cache"
+        except RuntimeError:
+            # Fallback to temp directory if there's no home directory
+            cache_root = tempfile.gettempdir()
+
+    return Path(cache_root) / CACHE_DIR_NAME / CACHE_FILE_NAME
 
 
 class CloudflarePricing:
@@ -96,16 +149,55 @@ class CloudflarePricing:
     Cloudflare domain pricing client using cfdomainpricing.com.
 
     Features:
-    - File-based caching with 24-hour TTL
+    - File-based caching with a configurable TTL (24 hours by default)
     - Graceful fallback to stale cache on fetch failures
     - In-memory TLD -> pricing mapping for fast lookups
     """
 
-    def __init__(self, timeout: float = 10.0):
+    def __init__(self, timeout: float = 10.0, cache_ttl_seconds: int = CACHE_TTL_SECONDS):
         """Initialize pricing client."""
         self.timeout = timeout
+        self.cache_ttl_seconds = cache_ttl_seconds
         self._tld_cache: Dict[str, Dict[str, float]] = {}  # tld -> {registration, renewal}
         self._cache_loaded_at: Optional[float] = None
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._load_task: Optional["asyncio.Future[None]"] = None
+
+    async def _get_client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP client, creating it on first use."""
+        # Pooled keep-alive connections mean DNS and TLS are paid once per
+        # host per process; there is no per-request lookup left to cache.
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # Pooled connections belong to the loop that opened them (e.g. an
+            # earlier asyncio.run) and can't be reused or closed from here
+            self._client = None
+
+        if self._client is None:
+            # Deferred so a fresh file cache never pays for importing httpx
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                # Multiplex over one TLS session when the h2 extra is installed
+                http2=importlib.util.find_spec("h2") is not None,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (safe to call if never opened)."""
+        # A shielded load can outlive its waiters - stop it before closing the client
+        if self._load_task is not None and not self._load_task.done():
+            self._load_task.cancel()
+            await asyncio.gather(self._load_task, return_exceptions=True)
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     def _load_from_file_cache(self) -> Optional[Dict[str, Dict[str, float]]]:
         """Load pricing data from file cache."""
@@ -115,8 +207,7 @@ class CloudflarePricing:
             return None
 
         try:
-            with open(cache_path, "r") as f:
-                cached = json.load(f)
+            cached = _json_loads(cache_path.read_bytes())
 
             # Check if cache is still valid
             cached_at = cached.get("cached_at", 0)
@@ -126,7 +217,7 @@ class CloudflarePricing:
             return {
                 "pricing": pricing_data,
                 "cached_at": cached_at,
-                "is_stale": (time.time() - cached_at) > CACHE_TTL_SECONDS
+                "is_stale": (time.time() - cached_at) > self.cache_ttl_seconds
             }
         except (json.JSONDecodeError, KeyError, IOError):
             return None
@@ -136,14 +227,29 @@ class CloudflarePricing:
         cache_path = _get_cache_path()
 
         try:
-            with open(cache_path, "w") as f:
-                json.dump({
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp file per writer, swapped in atomically so readers
+            # and overlapping runs only ever see a complete file
+            fd, tmp_name = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=f".{CACHE_FILE_NAME}.", suffix=".tmp"
+            )
+        except OSError:
+            # Silently fail if we can't write cache
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps({
                     "cached_at": time.time(),
                     "pricing": pricing_data
-                }, f)
-        except IOError:
-            # Silently fail if we can't write cache
-            pass
+                }))
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            # Silently fail if we can't write cache, but don't leave temp files
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
 
     async def _fetch_pricing_data(self) -> Dict[str, Dict[str, float]]:
         """
@@ -152,26 +258,43 @@ class CloudflarePricing:
         Returns:
             Dict mapping TLD -> {registration: price, renewal: price}
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(PRICING_API_URL)
-            response.raise_for_status()
+        client = await self._get_client()
+        response = await client.get(PRICING_API_URL)
+        response.raise_for_status()
 
-            data = response.json()
+        data = _json_loads(response.content)
 
-            # Validate structure - expects {tld: {registration, renewal}}
-            if not isinstance(data, dict):
-                raise PricingError("Invalid pricing data format")
+        # Validate structure - expects {tld: {registration, renewal}}
+        if not isinstance(data, dict):
+            raise PricingError("Invalid pricing data format")
 
-            return data
+        return data
 
     async def _ensure_cache_loaded(self) -> None:
         """Ensure pricing data is loaded into memory."""
         # Check if we have fresh in-memory cache
         if self._tld_cache and self._cache_loaded_at:
             cache_age = time.time() - self._cache_loaded_at
-            if cache_age < CACHE_TTL_SECONDS:
+            if cache_age < self.cache_ttl_seconds:
                 return
 
+        # Share one load between concurrent callers instead of fetching per caller
+        if self._load_task is None or self._load_task.done():
+            self._load_task = asyncio.ensure_future(self._load_cache())
+            self._load_task.add_done_callback(self._clear_load_task)
+        # Shield so one waiter's cancellation doesn't cancel the load for the rest
+        await asyncio.shield(self._load_task)
+
+    def _clear_load_task(self, task: "asyncio.Future[None]") -> None:
+        """Forget a finished load so the next stale check starts a new one."""
+        if self._load_task is task:
+            self._load_task = None
+        # Mark a failure as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _load_cache(self) -> None:
+        """Load pricing data from the file cache or the network."""
         # Try file cache first
         file_cache = self._load_from_file_cache()
 
@@ -182,6 +305,8 @@ class CloudflarePricing:
             return
 
         # Need to fetch fresh data
+        import httpx
+
         try:
             fresh_data = await self._fetch_pricing_data()
             self._tld_cache = fresh_data
@@ -195,6 +320,23 @@ class CloudflarePricing:
             else:
                 raise PricingError(f"Failed to fetch pricing data: {e}")
 
+    def _price_from_table(self, domain: str, tld: str) -> Optional[DomainPrice]:
+        """Build a DomainPrice from the loaded pricing table, or None if unsupported."""
+        pricing_info = self._tld_cache.get(tld)
+        if not pricing_info:
+            return None
+
+        # Convert dollars to cents
+        registration = pricing_info.get("registration", 0)
+        renewal = pricing_info.get("renewal", registration)
+
+        return DomainPrice(
+            domain=domain,
+            tld=tld,
+            price_cents=int(registration * 100),
+            annual_renewal_cents=int(renewal * 100)
+        )
+
     async def get_tld_pricing(self, tld: str) -> Optional[DomainPrice]:
         """
         Get pricing information for a specific TLD.
@@ -209,24 +351,7 @@ class CloudflarePricing:
 
         # Normalize TLD (remove leading dot if present)
         tld = tld.lower().lstrip(".")
-
-        pricing_info = self._tld_cache.get(tld)
-        if not pricing_info:
-            return None
-
-        # Convert dollars to cents
-        registration = pricing_info.get("registration", 0)
-        renewal = pricing_info.get("renewal", registration)
-
-        price_cents = int(registration * 100)
-        renewal_cents = int(renewal * 100)
-
-        return DomainPrice(
-            domain=f".{tld}",
-            tld=tld,
-            price_cents=price_cents,
-            annual_renewal_cents=renewal_cents
-        )
+        return self._price_from_table(f".{tld}", tld)
 
     async def get_domain_pricing(self, domain: str) -> Optional[DomainPrice]:
         """
@@ -238,21 +363,9 @@ class CloudflarePricing:
         Returns:
             DomainPrice object or None if TLD not supported by Cloudflare
         """
-        # Extract TLD
-        tld = domain.lower().split(".")[-1]
-        pricing = await self.get_tld_pricing(tld)
-
-        if pricing:
-            # Create a copy with the full domain name
-            return DomainPrice(
-                domain=domain,
-                tld=pricing.tld,
-                price_cents=pricing.price_cents,
-                currency=pricing.currency,
-                annual_renewal_cents=pricing.annual_renewal_cents
-            )
+        await self._ensure_cache_loaded()
 
-        return None
+        return self._price_from_table(domain, _extract_tld(domain))
 
     async def batch_pricing(self, domains: List[str]) -> Dict[str, DomainPrice]:
         """
@@ -266,22 +379,12 @@ class CloudflarePricing:
         """
         await self._ensure_cache_loaded()
 
+        # One table load serves every domain in the batch
         domain_pricing = {}
         for domain in domains:
-            tld = domain.lower().split(".")[-1]
-            pricing_info = self._tld_cache.get(tld)
-
-            if pricing_info:
-                registration = pricing_info.get("registration", 0)
-                renewal = pricing_info.get("renewal", registration)
-
-                domain_pricing[domain] = DomainPrice(
-                    domain=domain,
-                    tld=tld,
-                    price_cents=int(registration * 100),
-                    currency="USD",
-                    annual_renewal_cents=int(renewal * 100)
-                )
+            price = self._price_from_table(domain, _extract_tld(domain))
+            if price:
+                domain_pricing[domain] = price
 
         return domain_pricing
 
@@ -351,6 +454,20 @@ async def get_supported_tlds() -> List[str]:
     return await pricing_client.get_supported_tlds()
 
 
+async def preload_pricing() -> None:
+    """
+    Load the pricing table ahead of time so later lookups hit the cache.
+
+    Useful for overlapping the pricing fetch with other slow work.
+    """
+    await pricing_client._ensure_cache_loaded()
+
+
+async def close_pricing_client() -> None:
+    """Close the shared pricing client's HTTP connections."""
+    await pricing_client.aclose()
+
+
 def categorize_domains_by_pricing(domain_prices: Dict[str, DomainPrice]) -> Dict[str, List[str]]:
     """
     Categorize domains by pricing tiers.
@@ -368,7 +485,9 @@ def categorize_domains_by_pricing(domain_prices: Dict[str, DomainPrice]) -> Dict
         "premium": []
     }
 
+    # Pre-bind appends so the loop does one lookup per domain
+    appenders = {category: domains.append for category, domains in categories.items()}
     for domain, price_info in domain_prices.items():
-        categories[price_info.category].append(domain)
+        appenders[price_info.category](domain)
 
-    return categories
\ No newline at end of file
+    return categories
@@ -0,0 +1,170 @@
+"""
+Tests for Cloudflare pricing lookups.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from forage.pricing import CloudflarePricing, DomainPrice, categorize_domains_by_pricing
+
+
+SAMPLE_PRICING = {
+    "com": {"registration": 10.44, "renewal": 10.44},
+    "io": {"registration": 50.0, "renewal": 60.0},
+    "dev": {"registration": 12.0},
+}
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Pricing client with the file cache redirected to a temp directory."""
+    with patch("forage.pricing._get_cache_path", return_value=tmp_path / "cache.json"):
+        yield CloudflarePricing()
+
+
+class TestDomainPrice:
+    """Tests for DomainPrice."""
+
+    def test_to_dict(self):
+        """Test serialization includes derived tier flags."""
+        data = DomainPrice(domain="a.io", tld="io", price_cents=6000).to_dict()
+
+        assert data["price_dollars"] == 60.0
+        assert data["category"] == "premium"
+        assert data["is_premium"] is True
+        assert data["is_bundled"] is False
+
+
+class TestCloudflarePricing:
+    """Tests for CloudflarePricing."""
+
+    @pytest.mark.asyncio
+    async def test_batch_pricing_fetches_once(self, client):
+        """Test a batch across several TLDs hits the network once."""
+        fetch = AsyncMock(return_value=SAMPLE_PRICING)
+        with patch.object(client, "_fetch_pricing_data", fetch):
+            prices = await client.batch_pricing(["a.com", "b.io", "c.dev", "d.xyz"])
+
+        assert fetch.await_count == 1
+        assert set(prices) == {"a.com", "b.io", "c.dev"}
+        assert prices["a.com"].price_cents == 1044
+        assert prices["b.io"].annual_renewal_cents == 6000
+        assert prices["c.dev"].annual_renewal_cents == 1200
+
+    @pytest.mark.asyncio
+    async def test_single_lookups_share_table(self, client):
+        """Test single-domain and TLD lookups reuse the loaded table."""
+        fetch = AsyncMock(return_value=SAMPLE_PRICING)
+        with patch.object(client, "_fetch_pricing_data", fetch):
+            domain_price = await client.get_domain_pricing("Example.COM")
+            tld_price = await client.get_tld_pricing(".io")
+            missing = await client.get_domain_pricing("example.xyz")
+
+        assert fetch.await_count == 1
+        assert domain_price.domain == "Example.COM"
+        assert domain_price.tld == "com"
+        assert tld_price.domain == ".io"
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_file_cache_reused_across_instances(self, client):
+        """Test a fresh file cache spares the next client a fetch."""
+        with patch.object(client, "_fetch_pricing_data", AsyncMock(return_value=SAMPLE_PRICING)):
+            await client.get_supported_tlds()
+
+        second = CloudflarePricing()
+        fetch = AsyncMock(return_value=SAMPLE_PRICING)
+        with patch.object(second, "_fetch_pricing_data", fetch):
+            tlds = await second.get_supported_tlds()
+
+        assert fetch.await_count == 0
+        assert sorted(tlds) == ["com", "dev", "io"]
+
+    @pytest.mark.asyncio
+    async def test_expired_file_cache_refetches(self, client):
+        """Test a zero TTL treats the file cache as stale."""
+        with patch.object(client, "_fetch_pricing_data", AsyncMock(return_value=SAMPLE_PRICING)):
+            await client.get_supported_tlds()
+
+        second = CloudflarePricing(cache_ttl_seconds=0)
+        fetch = AsyncMock(return_value=SAMPLE_PRICING)
+        with patch.object(second, "_fetch_pricing_data", fetch):
+            await second.get_supported_tlds()
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self, client):
+        """Test concurrent cold lookups wait on a single in-flight fetch."""
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return SAMPLE_PRICING
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        with patch.object(client, "_fetch_pricing_data", fetch):
+            results = await asyncio.gather(
+                *(client.get_domain_pricing(f"site{i}.com") for i in range(5))
+            )
+
+        assert fetch.await_count == 1
+        assert all(r.price_cents == 1044 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_fetch(self, client):
+        """Test cancelling one concurrent waiter leaves the others their prices."""
+        async def slow_fetch():
+            await asyncio.sleep(0.05)
+            return SAMPLE_PRICING
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        with patch.object(client, "_fetch_pricing_data", fetch):
+            tasks = [
+                asyncio.create_task(client.get_domain_pricing(f"site{i}.com"))
+                for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            tasks[0].cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert fetch.await_count == 1
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert all(r.price_cents == 1044 for r in results[1:])
+
+    def test_file_cache_write_is_atomic(self, tmp_path):
+        """Test saving creates the cache dir and leaves no temp files behind."""
+        cache_path = tmp_path / "forage" / "cache.json"
+        with patch("forage.pricing._get_cache_path", return_value=cache_path):
+            client = CloudflarePricing()
+            assert client._load_from_file_cache() is None
+            assert not cache_path.parent.exists()
+
+            client._save_to_file_cache(SAMPLE_PRICING)
+            client._save_to_file_cache(SAMPLE_PRICING)
+
+            assert client._load_from_file_cache()["pricing"] == SAMPLE_PRICING
+        assert [p.name for p in cache_path.parent.iterdir()] == ["cache.json"]
+
+    def test_client_rebuilt_for_new_event_loop(self, client):
+        """Test a client from an earlier asyncio.run isn't reused on a new loop."""
+        first = asyncio.run(client._get_client())
+        second = asyncio.run(client._get_client())
+
+        assert second is not first
+        asyncio.run(client.aclose())
+
+
+class TestCategorizeDomains:
+    """Tests for categorize_domains_by_pricing."""
+
+    @pytest.mark.asyncio
+    async def test_categories(self, client):
+        """Test domains land in the tier matching their price."""
+        with patch.object(client, "_fetch_pricing_data", AsyncMock(return_value=SAMPLE_PRICING)):
+            prices = await client.batch_pricing(["a.com", "b.io"])
+
+        categories = categorize_domains_by_pricing(prices)
+
+        assert categories["bundled"] == ["a.com"]
+        assert categories["recommended"] == ["b.io"]
+        assert categories["standard"] == []